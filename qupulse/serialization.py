@@ -3,6 +3,7 @@
 Classes:
     - StorageBackend: Abstract representation of a data storage.
     - FilesystemBackend: Implementation of a file system data storage.
+    - AggregatedFilesystemBackend: Like FilesystemBackend but all data items share a single blob file
     - ZipFileBackend: Like FilesystemBackend but inside a single zip file instead of a directory
     - CachingBackend: A caching decorator for StorageBackends.
     - Serializable: An interface for serializable objects.
@@ -20,32 +21,84 @@ Functions:
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Any, Optional, NamedTuple, Union, Mapping, MutableMapping, Set, Callable, Iterator, Iterable
+from typing import Dict, Any, Optional, NamedTuple, Union, Mapping, MutableMapping, Set, Tuple, Callable, Iterator, \
+    Iterable
+import copy
+import mmap
 import os
+import struct
+import sys
 import zipfile
 import tempfile
+import time
 import json
 import weakref
 import warnings
+import functools
 import gc
 import importlib
 import warnings
+import concurrent.futures
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from qupulse.utils.types import DocStringABCMeta, FrozenDict
 
-__all__ = ["StorageBackend", "FilesystemBackend", "ZipFileBackend", "CachingBackend", "Serializable", "Serializer",
+try:
+    # orjson is an optional dependency that speeds up parsing of stored pulses considerably.
+    # Encoding intentionally stays on the stdlib encoder: the storage format is indent-4, key-sorted JSON
+    # which orjson cannot produce.
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["StorageBackend", "FilesystemBackend", "AggregatedFilesystemBackend", "ZipFileBackend", "CachingBackend",
+           "Serializable", "Serializer",
            "AnonymousSerializable", "DictBackend", "PulseStorage",
            "convert_pulses_in_storage", "convert_stored_pulse_in_storage", "PulseRegistryType", "get_default_pulse_registry",
            "set_default_pulse_registry", "new_default_pulse_registry"]
 
 
+def _loads_json(serialization: Union[str, bytes]) -> Any:
+    """Parses a JSON document into Python objects, using the C-accelerated orjson parser if installed.
+
+    orjson is stricter than the stdlib encoder that writes the stored pulses: it rejects NaN/Infinity and
+    integers outside the 64 bit range. Documents it cannot parse are retried with the stdlib decoder, so
+    orjson stays a fast path rather than a stricter format.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(serialization)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(serialization)
+
+
+def _apply_object_hook(node: Any, object_hook: Callable[[dict], Any]) -> Any:
+    """Applies object_hook bottom-up to every dict in an already-parsed JSON tree.
+
+    This replicates the object_hook semantics of json.JSONDecoder for parsers like orjson that parse the
+    complete document in C and do not support decode hooks.
+    """
+    if isinstance(node, dict):
+        return object_hook({key: _apply_object_hook(value, object_hook) for key, value in node.items()})
+    if isinstance(node, list):
+        return [_apply_object_hook(item, object_hook) for item in node]
+    return node
+
+
 class StorageBackend(metaclass=ABCMeta):
     """A backend to store data/files in.
 
     Used as an abstraction of file systems/databases for the serializer.
     """
 
+    __slots__ = ()
+
+    #: Whether concurrent put calls from multiple threads are safe. True only for backends where independent
+    #: identifiers map to independent resources (e.g. separate files).
+    supports_parallel_put = False
+
     @abstractmethod
     def put(self, identifier: str, data: str, overwrite: bool=False) -> None:
         """Stores the data string identified by identifier.
@@ -63,6 +116,53 @@ class StorageBackend(metaclass=ABCMeta):
     def __setitem__(self, identifier: str, data: str) -> None:
         self.put(identifier, data)
 
+    def put_many(self, entries: Mapping[str, str], overwrite: bool=False) -> None:
+        """Stores several data strings in a single batch.
+
+        Backends may override this to amortize their per-operation overhead over the whole batch, e.g. by
+        submitting all writes through one file handle. The default implementation stores the entries one by one.
+
+        Args:
+            entries: A mapping from identifier to the serialized data to be stored under it.
+            overwrite: Set to True, if already existing data shall be overwritten.
+                (default: False)
+        Raises:
+            FileExistsError if overwrite is False and there already exists data which
+                is associated with one of the given identifiers.
+        """
+        with self.transaction():
+            for identifier, data in entries.items():
+                self.put(identifier, data, overwrite)
+
+    def get_many(self, identifiers: Iterable[str]) -> Dict[str, str]:
+        """Retrieves several data strings in a single batch.
+
+        Args:
+            identifiers: An iterable of identifiers of the data to be retrieved.
+        Returns:
+            A dictionary mapping each identifier to the data associated with it.
+        Raises:
+            KeyError if no data is associated with one of the given identifiers.
+        """
+        return {identifier: self.get(identifier) for identifier in identifiers}
+
+    def put_bytes(self, identifier: str, data: bytes, overwrite: bool=False) -> None:
+        """Stores an already UTF-8 encoded data string.
+
+        Backends that write raw bytes anyway may override this to skip a decode/encode round trip. The
+        default implementation decodes the data and delegates to put.
+
+        Args:
+            identifier (str): A unique identifier/name for the data to be stored.
+            data (bytes): The UTF-8 encoded serialized data to be stored.
+            overwrite (bool): Set to True, if already existing data shall be overwritten.
+                (default: False)
+        Raises:
+            FileExistsError if overwrite is False and there already exists data which
+                is associated with the given identifier.
+        """
+        self.put(identifier, data.decode('utf-8'), overwrite)
+
     @abstractmethod
     def get(self, identifier: str) -> str:
         """Retrieves the data string with the given identifier.
@@ -105,6 +205,17 @@ class StorageBackend(metaclass=ABCMeta):
     def __delitem__(self, identifier: str) -> None:
         self.delete(identifier)
 
+    @contextmanager
+    def transaction(self) -> Iterator['StorageBackend']:
+        """Context manager batching all storage operations issued inside the with-statement.
+
+        Backends with expensive per-operation overhead (such as ZipFileBackend) may defer writes and deletes
+        issued during the transaction and apply them in a single pass on exit. If the with-block raises, deferred
+        operations are discarded. The default implementation does nothing, i.e., all operations are applied
+        immediately as usual.
+        """
+        yield self
+
     def list_contents(self) -> Iterable[str]:
         """Returns a listing of all available identifiers.
 
@@ -139,13 +250,20 @@ class FilesystemBackend(StorageBackend):
     argument is explicitly set to True.
     """
 
-    def __init__(self, root: str='.', create_if_missing: bool=False) -> None:
+    __slots__ = ('_root', '_root_prefix', '_fsync')
+
+    # puts for different identifiers touch different files and are atomic (O_EXCL / os.replace)
+    supports_parallel_put = True
+
+    def __init__(self, root: str='.', create_if_missing: bool=False, fsync: bool=False) -> None:
         """Creates a new FilesystemBackend.
 
         Args:
             root: The path of the directory in which all data files are located. (default: ".",
                 i.e. the current directory)
             create_if_missing: If False, do not create the specified directory if it does not exist. (default: False)
+            fsync: If True, flush every written file to disk via os.fsync before it replaces the stored data.
+                This makes writes durable against power loss at the cost of one disk sync per put. (default: False)
         Raises:
             NotADirectoryError: if root is not a valid directory path.
         """
@@ -154,28 +272,62 @@ class FilesystemBackend(StorageBackend):
         if not os.path.isdir(root):
             raise NotADirectoryError()
         self._root = os.path.abspath(root)
+        self._root_prefix = self._root + os.sep
+        self._fsync = fsync
 
     def _path(self, identifier) -> str:
-        return os.path.join(self._root, identifier + '.json')
+        return "{}{}.json".format(self._root_prefix, identifier)
+
+    def _write_file(self, path: str, data: bytes, exclusive: bool=False) -> None:
+        """Writes the given contents to the file at path.
+
+        If exclusive is True the file is created with O_EXCL, so existence check and creation are a single
+        atomic syscall and FileExistsError is raised for an already present file. Otherwise the data is written
+        to a temporary file in the same directory which then replaces the target via os.replace, so readers
+        never observe a partially written file.
+        """
+        if exclusive:
+            tmp_path = path
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        else:
+            tmp_path = path + '.tmp'
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if self._fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if tmp_path is not path:
+            os.replace(tmp_path, path)
 
     def put(self, identifier: str, data: str, overwrite: bool=False) -> None:
-        if self.exists(identifier) and not overwrite:
-            raise FileExistsError(identifier)
-        path = self._path(identifier)
-        with open(path, 'w') as file:
-            file.write(data)
+        self.put_bytes(identifier, data.encode('utf-8'), overwrite)
+
+    def put_bytes(self, identifier: str, data: bytes, overwrite: bool=False) -> None:
+        try:
+            self._write_file(self._path(identifier), data, exclusive=not overwrite)
+        except FileExistsError:
+            raise FileExistsError(identifier) from None
+
+    # files larger than this are decoded straight out of a memory map instead of a read() buffer copy
+    _MMAP_THRESHOLD = 64 * 1024
 
     def get(self, identifier: str) -> str:
         path = self._path(identifier)
         try:
-            with open(path) as file:
-                return file.read()
+            with open(path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size > self._MMAP_THRESHOLD:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return str(mapped, 'utf-8')
+                return str(file.read(), 'utf-8')
         except FileNotFoundError as fnf:
             raise KeyError(identifier) from fnf
 
     def exists(self, identifier: str) -> bool:
-        path = self._path(identifier)
-        return os.path.isfile(path)
+        return os.access(self._path(identifier), os.F_OK)
 
     def delete(self, identifier):
         try:
@@ -188,6 +340,181 @@ class FilesystemBackend(StorageBackend):
             return (filename for filename, ext in (os.path.splitext(file) for file in files) if ext == '.json')
 
 
+class AggregatedFilesystemBackend(StorageBackend):
+    """A StorageBackend that aggregates all data items into a single file.
+
+    Serialized data is appended to one blob file while a JSON manifest maps each identifier to its
+    offset and length within the blob. Compared to FilesystemBackend, storing a transaction of N
+    pulses costs one append plus one atomic manifest update instead of N file creations, which is
+    considerably faster for many small entries.
+
+    Overwriting or deleting only updates the manifest; the superseded data stays in the blob until
+    :meth:`compact` is called.
+    """
+
+    __slots__ = ('_root', '_blob_path', '_manifest_path', '_manifest', '_manifest_fingerprint')
+
+    def __init__(self, root: str='.', create_if_missing: bool=False) -> None:
+        """Creates a new AggregatedFilesystemBackend.
+
+        Args:
+            root: The path of the directory in which the blob and manifest files are located.
+                (default: ".", i.e. the current directory)
+            create_if_missing: If False, do not create the specified directory if it does not exist.
+                (default: False)
+        Raises:
+            NotADirectoryError: if root is not a valid directory path.
+        """
+        if not os.path.exists(root) and create_if_missing:
+            os.makedirs(root)
+        if not os.path.isdir(root):
+            raise NotADirectoryError()
+        self._root = os.path.abspath(root)
+        self._blob_path = os.path.join(self._root, 'storage.blob')
+        self._manifest_path = os.path.join(self._root, 'storage.manifest.json')
+        self._manifest = {} # type: Dict[str, Tuple[int, int]]
+        self._manifest_fingerprint = None
+        self._load_manifest()
+
+    def _load_manifest(self) -> None:
+        """Reloads the manifest from disk if it changed since the last load (detected via its stat fingerprint)."""
+        try:
+            stat = os.stat(self._manifest_path)
+        except FileNotFoundError:
+            self._manifest = {}
+            self._manifest_fingerprint = None
+            return
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        if fingerprint != self._manifest_fingerprint:
+            with open(self._manifest_path, 'rb') as manifest_file:
+                raw_manifest = _loads_json(manifest_file.read())
+            self._manifest = {identifier: (offset, length) for identifier, (offset, length) in raw_manifest.items()}
+            self._manifest_fingerprint = fingerprint
+
+    def _store_manifest(self) -> None:
+        """Atomically replaces the manifest on disk with the in-memory one."""
+        data = json.dumps({identifier: list(span) for identifier, span in self._manifest.items()}).encode('utf-8')
+        tmp_path = self._manifest_path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self._manifest_path)
+        stat = os.stat(self._manifest_path)
+        self._manifest_fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+    def _append_blob(self, chunks: Iterable[bytes]) -> int:
+        """Appends the given chunks to the blob file and returns the offset the first chunk was written to.
+
+        Where the platform provides os.writev, all chunks are submitted as one scatter-gather syscall
+        instead of one write per chunk.
+        """
+        fd = os.open(self._blob_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            start_offset = os.lseek(fd, 0, os.SEEK_END)
+            if hasattr(os, 'writev'):
+                buffers = [memoryview(chunk) for chunk in chunks if chunk]
+                while buffers:
+                    # stay below the POSIX minimum for IOV_MAX and drop whatever was fully written
+                    written = os.writev(fd, buffers[:1024])
+                    while buffers and written >= len(buffers[0]):
+                        written -= len(buffers[0])
+                        del buffers[0]
+                    if written:
+                        buffers[0] = buffers[0][written:]
+            else:
+                for chunk in chunks:
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return start_offset
+
+    def put(self, identifier: str, data: str, overwrite: bool=False) -> None:
+        self.put_many({identifier: data}, overwrite=overwrite)
+
+    def put_bytes(self, identifier: str, data: bytes, overwrite: bool=False) -> None:
+        self._load_manifest()
+        if not overwrite and identifier in self._manifest:
+            raise FileExistsError(identifier)
+        offset = self._append_blob((data,))
+        self._manifest[identifier] = (offset, len(data))
+        self._store_manifest()
+
+    def put_many(self, entries: Mapping[str, str], overwrite: bool=False) -> None:
+        self._load_manifest()
+        if not overwrite:
+            for identifier in entries:
+                if identifier in self._manifest:
+                    raise FileExistsError(identifier)
+        chunks = [data.encode('utf-8') for data in entries.values()]
+        offset = self._append_blob(chunks)
+        for identifier, chunk in zip(entries, chunks):
+            self._manifest[identifier] = (offset, len(chunk))
+            offset += len(chunk)
+        self._store_manifest()
+
+    def get(self, identifier: str) -> str:
+        self._load_manifest()
+        offset, length = self._manifest[identifier]
+        with open(self._blob_path, 'rb') as blob:
+            blob.seek(offset)
+            return blob.read(length).decode('utf-8')
+
+    def get_many(self, identifiers: Iterable[str]) -> Dict[str, str]:
+        self._load_manifest()
+        spans = {identifier: self._manifest[identifier] for identifier in identifiers}
+        result = {}
+        with open(self._blob_path, 'rb') as blob:
+            # read in blob order so a single sequential pass suffices
+            for identifier, (offset, length) in sorted(spans.items(), key=lambda item: item[1]):
+                blob.seek(offset)
+                result[identifier] = blob.read(length).decode('utf-8')
+        return result
+
+    def exists(self, identifier: str) -> bool:
+        self._load_manifest()
+        return identifier in self._manifest
+
+    def delete(self, identifier: str) -> None:
+        self._load_manifest()
+        try:
+            del self._manifest[identifier]
+        except KeyError:
+            raise KeyError(identifier) from None
+        self._store_manifest()
+
+    def compact(self) -> None:
+        """Rewrites the blob file, dropping data that is no longer referenced by any identifier."""
+        self._load_manifest()
+        tmpfd, tmpname = tempfile.mkstemp(dir=self._root)
+        new_manifest = {}
+        offset = 0
+        try:
+            if self._manifest:
+                with open(self._blob_path, 'rb') as blob:
+                    for identifier, (old_offset, length) in sorted(self._manifest.items(), key=lambda item: item[1]):
+                        blob.seek(old_offset)
+                        view = memoryview(blob.read(length))
+                        while view:
+                            view = view[os.write(tmpfd, view):]
+                        new_manifest[identifier] = (offset, length)
+                        offset += length
+        finally:
+            os.close(tmpfd)
+        os.replace(tmpname, self._blob_path)
+        self._manifest = new_manifest
+        self._store_manifest()
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_manifest()
+        return iter(tuple(self._manifest))
+
+
 class ZipFileBackend(StorageBackend):
     """A StorageBackend implementation based on a single zip file.
 
@@ -199,7 +526,11 @@ class ZipFileBackend(StorageBackend):
     network devices, but takes longer to update because every write causes a
     complete recompression (it's not too bad)."""
 
-    def __init__(self, root: str='./storage.zip', compression_method: int=zipfile.ZIP_DEFLATED) -> None:
+    __slots__ = ('_root', '_compression_method', '_compression_level', '_zip_write_kwargs', '_store_threshold',
+                 '_pending', '_name_cache', '_name_cache_fingerprint', '_read_handle', '_read_handle_fingerprint')
+
+    def __init__(self, root: str='./storage.zip', compression_method: int=zipfile.ZIP_DEFLATED,
+                 compression_level: Optional[int]=1, store_threshold: int=4096) -> None:
         """Creates a new FilesystemBackend.
 
         Args:
@@ -209,6 +540,14 @@ class ZipFileBackend(StorageBackend):
                 all values handled by the zipfile module (ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA). Please refer
                 to the `zipfile docs <https://docs.python.org/3/library/zipfile.html#zipfile.ZIP_STORED>` for more
                 information. (default: zipfile.ZIP_DEFLATED)
+            compression_level: The compression level passed on to the zipfile module. Lower levels trade archive
+                size for (significantly) faster writes; on the JSON text stored here, level 1 compresses several
+                times faster than zlib's default level 6 at only slightly worse ratio. If None, the default of
+                the compression method is used. Ignored on Python < 3.7, where zipfile does not support
+                per-archive compression levels. (default: 1)
+            store_threshold: Entries smaller than this many characters are stored uncompressed, since the
+                per-entry setup overhead of DEFLATE dominates for small payloads. Set to 0 to always compress.
+                (default: 4096)
         Raises:
             NotADirectoryError if root is not a valid path.
         """
@@ -224,104 +563,295 @@ class ZipFileBackend(StorageBackend):
             raise FileExistsError("Cannot open a ZipStorageBackend. The file {} is not a zip archive.".format(root))
         self._root = root
         self._compression_method = compression_method
+        self._compression_level = compression_level
+        self._zip_write_kwargs = {'compression': compression_method}
+        if compression_level is not None and sys.version_info >= (3, 7):
+            # zipfile.ZipFile only accepts compresslevel since Python 3.7
+            self._zip_write_kwargs['compresslevel'] = compression_level
+        self._store_threshold = store_threshold
+        self._pending = None # type: Optional[Dict[str, Optional[str]]]
+        self._name_cache = None # type: Optional[Set[str]]
+        self._name_cache_fingerprint = None
+        self._read_handle = None # type: Optional[zipfile.ZipFile]
+        self._read_handle_fingerprint = None
 
     def _path(self, identifier) -> str:
         return os.path.join(identifier + '.json')
 
+    def _entry_names(self) -> Set[str]:
+        """Returns the set of entry names in the archive, cached between calls.
+
+        The cache is kept up to date on mutations through this backend and is re-read from the archive when
+        the file changes on disk (detected via its stat fingerprint), e.g. due to external modifications.
+        """
+        stat = os.stat(self._root)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        if self._name_cache is None or self._name_cache_fingerprint != fingerprint:
+            self._name_cache = set(self._reader().namelist())
+            self._name_cache_fingerprint = fingerprint
+        return self._name_cache
+
+    def _write_entry(self, myzip: zipfile.ZipFile, path: str, data: str) -> None:
+        """Writes a single entry, storing small payloads uncompressed to skip the deflate round-trip."""
+        if len(data) < self._store_threshold:
+            info = zipfile.ZipInfo(path, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            info.external_attr = 0o600 << 16 # same permissions as writestr assigns for plain names
+            myzip.writestr(info, data)
+        else:
+            myzip.writestr(path, data)
+
+    def _reader(self) -> zipfile.ZipFile:
+        """Returns a long-lived read-mode handle to the archive.
+
+        The handle is kept open between calls so that the central directory is only parsed again when the
+        archive file changes on disk (detected via its stat fingerprint).
+        """
+        stat = os.stat(self._root)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        if self._read_handle is None or self._read_handle_fingerprint != fingerprint:
+            self._close_read_handle()
+            self._read_handle = zipfile.ZipFile(self._root, 'r')
+            self._read_handle_fingerprint = fingerprint
+        return self._read_handle
+
+    def _close_read_handle(self) -> None:
+        if self._read_handle is not None:
+            self._read_handle.close()
+            self._read_handle = None
+            self._read_handle_fingerprint = None
+
+    def _names_changed(self, changes: Mapping[str, Optional[str]]) -> None:
+        """Updates the cached name listing after an archive mutation performed by this backend."""
+        self._close_read_handle()
+        if self._name_cache is None:
+            return
+        for path, data in changes.items():
+            if data is None:
+                self._name_cache.discard(path)
+            else:
+                self._name_cache.add(path)
+        try:
+            stat = os.stat(self._root)
+            self._name_cache_fingerprint = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            self._name_cache = None
+
     def put(self, identifier: str, data: str, overwrite: bool=False) -> None:
         if not self.exists(identifier):
-            with zipfile.ZipFile(self._root, mode='a', compression=self._compression_method) as myzip:
-                path = self._path(identifier)
-                myzip.writestr(path, data)
+            if self._pending is not None:
+                self._pending[self._path(identifier)] = data
+                return
+            path = self._path(identifier)
+            with zipfile.ZipFile(self._root, mode='a', **self._zip_write_kwargs) as myzip:
+                self._write_entry(myzip, path, data)
+            self._names_changed({path: data})
         else:
             if overwrite:
+                if self._pending is not None:
+                    self._pending[self._path(identifier)] = data
+                    return
                 self._update(self._path(identifier), data)
             else:
                 raise FileExistsError(identifier)
 
     def get(self, identifier: str) -> str:
         path = self._path(identifier)
+        if self._pending is not None and path in self._pending:
+            data = self._pending[path]
+            if data is None:
+                raise KeyError(identifier)
+            return data
         try:
-            with zipfile.ZipFile(self._root) as myzip:
-                with myzip.open(path) as file:
-                    return file.read().decode()
+            with self._reader().open(path) as file:
+                return file.read().decode()
         except FileNotFoundError as fnf:
             raise KeyError(identifier) from fnf
 
     def exists(self, identifier: str) -> bool:
         path = self._path(identifier)
-        with zipfile.ZipFile(self._root, 'r') as myzip:
-            return path in myzip.namelist()
+        if self._pending is not None and path in self._pending:
+            return self._pending[path] is not None
+        return path in self._entry_names()
 
     def delete(self, identifier: str) -> None:
         if not self.exists(identifier):
             raise KeyError(identifier)
+        if self._pending is not None:
+            self._pending[self._path(identifier)] = None
+            return
         self._update(self._path(identifier), None)
 
+    @contextmanager
+    def transaction(self) -> Iterator['ZipFileBackend']:
+        """Context manager deferring all writes and deletes issued inside the with-statement.
+
+        The deferred operations are applied in a single pass on exit: new entries are appended through one
+        zipfile handle and at most one archive rewrite is performed for overwrites and deletes, instead of one
+        archive open (or rewrite) per operation. Reads inside the transaction see the deferred state. If the
+        with-block raises, all deferred operations are discarded.
+        """
+        if self._pending is not None:
+            # nested transaction; the outermost one commits
+            yield self
+            return
+        self._pending = dict()
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+        else:
+            pending, self._pending = self._pending, None
+            self._commit(pending)
+
+    def _commit(self, pending: Dict[str, Optional[str]]) -> None:
+        if not pending:
+            return
+        existing = self._entry_names()
+        if any(data is None or path in existing for path, data in pending.items()):
+            self._update_many(pending)
+        else:
+            with zipfile.ZipFile(self._root, mode='a', **self._zip_write_kwargs) as myzip:
+                for path, data in pending.items():
+                    self._write_entry(myzip, path, data)
+            self._names_changed(pending)
+
+    @staticmethod
+    def _copy_compressed(zin: zipfile.ZipFile, zout: zipfile.ZipFile, item: zipfile.ZipInfo) -> None:
+        """Appends the entry item of zin to zout without decompressing and recompressing its contents.
+
+        The raw, still compressed bytes of the entry are copied directly from the underlying file object,
+        which avoids one inflate/deflate round-trip per untouched entry when rewriting an archive.
+        """
+        if item.flag_bits & 0x1:
+            # encrypted entries cannot be rewritten from the central directory metadata alone
+            zout.writestr(item, zin.read(item.filename))
+            return
+
+        # seek past the local file header of the source entry to the start of the compressed data
+        zin.fp.seek(item.header_offset)
+        fheader = struct.unpack(zipfile.structFileHeader, zin.fp.read(zipfile.sizeFileHeader))
+        zin.fp.seek(fheader[zipfile._FH_FILENAME_LENGTH] + fheader[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+        copied = copy.copy(item)
+        copied.flag_bits &= ~0x8  # sizes and CRC are known; no data descriptor required
+        zip64 = item.file_size > zipfile.ZIP64_LIMIT or item.compress_size > zipfile.ZIP64_LIMIT
+
+        zout._writecheck(copied)
+        copied.header_offset = zout.fp.tell()
+        zout.fp.write(copied.FileHeader(zip64=zip64))
+        remaining = item.compress_size
+        while remaining > 0:
+            chunk = zin.fp.read(min(remaining, 64*1024))
+            if not chunk:
+                raise zipfile.BadZipFile("Truncated entry {} in {}".format(item.filename, zin.filename))
+            zout.fp.write(chunk)
+            remaining -= len(chunk)
+        zout.start_dir = zout.fp.tell()
+        zout._didModify = True
+        zout.filelist.append(copied)
+        zout.NameToInfo[copied.filename] = copied
+
     def _update(self, filename: str, data: Optional[str]) -> None:
+        self._update_many({filename: data})
+
+    def _update_many(self, updates: Dict[str, Optional[str]]) -> None:
+        # the archive file is going to be replaced; a stale read handle must not survive that
+        self._close_read_handle()
+
         # generate a temp file
         tmpfd, tmpname = tempfile.mkstemp(dir=os.path.dirname(self._root))
         os.close(tmpfd)
 
-        # create a temp copy of the archive without filename            
+        # create a temp copy of the archive without the updated entries
         with zipfile.ZipFile(self._root, 'r') as zin:
-            with zipfile.ZipFile(tmpname, 'w') as zout:
+            with zipfile.ZipFile(tmpname, 'w', **self._zip_write_kwargs) as zout:
                 zout.comment = zin.comment # preserve the comment
                 for item in zin.infolist():
-                    if item.filename != filename:
-                        zout.writestr(item, zin.read(item.filename))
+                    if item.filename not in updates:
+                        self._copy_compressed(zin, zout, item)
+
+                # now add the updated entries with their new data
+                for filename, data in updates.items():
+                    if data is not None:
+                        self._write_entry(zout, filename, data)
 
         # replace with the temp archive
         os.remove(self._root)
         os.rename(tmpname, self._root)
-
-        # now add filename with its new data
-        if data is not None:
-            with zipfile.ZipFile(self._root, mode='a', compression=self._compression_method) as zf:
-                zf.writestr(filename, data)
+        self._names_changed(updates)
 
     def __iter__(self) -> Iterator[str]:
-        with zipfile.ZipFile(self._root, 'r') as myzip:
-            return (filename
-                    for filename, ext in (os.path.splitext(file) for file in myzip.namelist())
-                    if ext == '.json')
+        names = set(self._entry_names())
+        if self._pending is not None:
+            names.update(path for path, data in self._pending.items() if data is not None)
+            names.difference_update(path for path, data in self._pending.items() if data is None)
+        return (filename
+                for filename, ext in (os.path.splitext(file) for file in names)
+                if ext == '.json')
 
 
 class CachingBackend(StorageBackend):
-    """Adds naive memory caching functionality to another StorageBackend.
+    """Adds memory caching functionality to another StorageBackend.
 
     CachingBackend relies on another StorageBackend to provide real data IO functionality which
     it extends by caching already opened files in memory for faster subsequent access.
 
-    Note that it does not automatically clear the cache at any time and thus will consume increasing amounts of memory
-    over time. Use the :meth:`clear_cache` method to clear the cache manually.
+    The cache is bounded: once it holds more than max_bytes of data or more than max_entries items, the least
+    recently used entries are evicted. Use the :meth:`clear_cache` method to clear the cache manually.
 
     DEPRECATED (2018-09-20): PulseStorage now already provides chaching around StorageBackends, rendering CachingBackend
     obsolete.
     """
 
-    def __init__(self, backend: StorageBackend) -> None:
+    __slots__ = ('_backend', '_cache', '_max_bytes', '_max_entries', '_bytes')
+
+    def __init__(self, backend: StorageBackend, max_bytes: int=256*1024*1024,
+                 max_entries: Optional[int]=None) -> None:
         """Creates a new CachingBackend.
 
         Args:
             backend (StorageBackend): A StorageBackend that provides data
                 IO functionality.
+            max_bytes (int): The maximum amount of memory (as measured by sys.getsizeof of the cached strings)
+                the cache may occupy before least recently used entries are evicted. (default: 256 MiB)
+            max_entries (Optional[int]): The maximum number of entries the cache may hold before least recently
+                used entries are evicted, regardless of their size. If None, only max_bytes bounds the cache.
+                (default: None)
         """
         warnings.warn("CachingBackend is obsolete due to PulseStorage already offering caching functionality.",
                       DeprecationWarning)
         self._backend = backend
-        self._cache = {}
+        self._cache = OrderedDict() # type: OrderedDict[str, str]
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._bytes = 0
+
+    def _cache_insert(self, identifier: str, data: str) -> None:
+        if identifier in self._cache:
+            self._bytes -= sys.getsizeof(self._cache[identifier])
+        self._cache[identifier] = data
+        self._cache.move_to_end(identifier)
+        self._bytes += sys.getsizeof(data)
+        while self._cache and (self._bytes > self._max_bytes or
+                               (self._max_entries is not None and len(self._cache) > self._max_entries)):
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= sys.getsizeof(evicted)
 
     def put(self, identifier: str, data: str, overwrite: bool=False) -> None:
         if identifier in self._cache and not overwrite:
             raise FileExistsError(identifier)
         self._backend.put(identifier, data, overwrite)
-        self._cache[identifier] = data
+        self._cache_insert(identifier, data)
 
     def get(self, identifier: str) -> str:
-        if identifier not in self._cache:
-            self._cache[identifier] = self._backend.get(identifier)
-        return self._cache[identifier]
+        if identifier in self._cache:
+            self._cache.move_to_end(identifier)
+            return self._cache[identifier]
+        data = self._backend.get(identifier)
+        self._cache_insert(identifier, data)
+        return data
 
     def exists(self, identifier: str) -> bool:
         return self._backend.exists(identifier)
@@ -329,13 +859,15 @@ class CachingBackend(StorageBackend):
     def delete(self, identifier: str) -> None:
         self._backend.delete(identifier)
         if identifier in self._cache:
+            self._bytes -= sys.getsizeof(self._cache[identifier])
             del self._cache[identifier]
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._backend)
 
     def clear_cache(self) -> None:
-        self._cache = dict()
+        self._cache = OrderedDict()
+        self._bytes = 0
 
 
 class DictBackend(StorageBackend):
@@ -343,6 +875,9 @@ class DictBackend(StorageBackend):
 
     Doing so, it does not provide any persistent storage functionality.
     """
+
+    __slots__ = ('_cache',)
+
     def __init__(self) -> None:
         self._cache = {}
 
@@ -408,6 +943,18 @@ class SerializableMeta(DocStringABCMeta):
         return cls
 
 
+@functools.lru_cache(maxsize=None)
+def _import_deserialization_callback(type_identifier: str) -> Callable:
+    """Resolves a type identifier to a deserialization callback by importing the module and looking up the class.
+
+    Fallback for types that did not register themselves in SerializableMeta.deserialization_callbacks. The result
+    is cached so repeated deserialization of the same type does not take the import-system round trip again.
+    """
+    module_name, class_name = type_identifier.rsplit('.', 1)
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name).deserialize
+
+
 PulseRegistryType = Optional[MutableMapping[str, 'Serializable']]
 default_pulse_registry = None # type: PulseRegistryType
 
@@ -462,6 +1009,9 @@ class Serializable(metaclass=SerializableMeta):
     type_identifier_name = '#type'
     identifier_name = '#identifier'
 
+    # The weakref slot is required because registered Serializables live in a weakref.WeakValueDictionary.
+    __slots__ = ('__identifier', '__weakref__')
+
     def __init__(self, identifier: Optional[str]=None) -> None:
         """Initializes a Serializable.
 
@@ -490,12 +1040,15 @@ class Serializable(metaclass=SerializableMeta):
             registry = default_pulse_registry
 
         if self.identifier and registry is not None:
-            if self.identifier in registry and isinstance(registry, weakref.WeakValueDictionary):
-                # trigger garbage collection in case the registered object isn't referenced anymore
-                gc.collect(2)
-
             if self.identifier in registry:
-                raise RuntimeError('Pulse with name already exists', self.identifier)
+                # A WeakValueDictionary drops entries as soon as their referent dies, so a hit means the
+                # registered object is either alive or kept around by an uncollected reference cycle. Only in
+                # that case pay for a full collection and check again before reporting a collision.
+                if isinstance(registry, weakref.WeakValueDictionary):
+                    gc.collect(2)
+
+                if self.identifier in registry:
+                    raise RuntimeError('Pulse with name already exists', self.identifier)
 
             registry[self.identifier] = self
 
@@ -538,7 +1091,12 @@ class Serializable(metaclass=SerializableMeta):
 
     @classmethod
     def get_type_identifier(cls) -> str:
-        return "{}.{}".format(cls.__module__, cls.__name__)
+        # cached per class; looked up via cls.__dict__ so a subclass does not inherit its parent's identifier
+        type_identifier = cls.__dict__.get('_type_identifier')
+        if type_identifier is None:
+            type_identifier = sys.intern("{}.{}".format(cls.__module__, cls.__name__))
+            cls._type_identifier = type_identifier
+        return type_identifier
 
     @classmethod
     def deserialize(cls, serializer: Optional['Serializer']=None, **kwargs) -> 'Serializable':
@@ -606,6 +1164,9 @@ class AnonymousSerializable:
         raise NotImplementedError()
 
 
+_TYPE_ID_CACHE = {} # type: Dict[type, str]
+
+
 class Serializer(object):
     """Serializes Serializable objects and stores them persistently.
 
@@ -689,9 +1250,7 @@ class Serializer(object):
         """
         self.__subpulses = dict()
         repr_ = self.dictify(serializable)
-        filedict = dict()
-        for identifier in self.__subpulses:
-            filedict[identifier] = self.__subpulses[identifier].serialization
+        filedict = {identifier: entry.serialization for identifier, entry in self.__subpulses.items()}
         if isinstance(repr_, dict):
             filedict[''] = repr_
         return filedict
@@ -705,7 +1264,13 @@ class Serializer(object):
         Returns:
             The type identifier as a string.
         """
-        return "{}.{}".format(obj.__module__, obj.__class__.__name__)
+        cls = type(obj)
+        type_identifier = _TYPE_ID_CACHE.get(cls)
+        if type_identifier is None:
+            # __name__ rather than __qualname__ keeps the identifiers compatible with stored pulse libraries
+            type_identifier = sys.intern("{}.{}".format(cls.__module__, cls.__name__))
+            _TYPE_ID_CACHE[cls] = type_identifier
+        return type_identifier
 
     def serialize(self, serializable: Serializable, overwrite=False) -> None:
         """Serializes and stores a Serializable.
@@ -723,13 +1288,25 @@ class Serializer(object):
         """
         warnings.warn("Serializer is deprecated. Please switch to the new serialization routines.", DeprecationWarning)
         repr_ = self.__collect_dictionaries(serializable)
-        for identifier in repr_:
+
+        def encode_and_put(identifier: str) -> None:
             storage_identifier = identifier
             if identifier == '':
                 storage_identifier = 'main'
+            # indent=4 with sorted keys is the canonical storage format; see PulseStorage._memoized_encode
             json_str = json.dumps(repr_[identifier], indent=4, sort_keys=True, cls=ExtendedJSONEncoder)
             self.__storage_backend.put(storage_identifier, json_str, overwrite)
 
+        if len(repr_) > 1 and self.__storage_backend.supports_parallel_put:
+            # the per-identifier encodes and puts are independent, so spread them over a thread pool
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(repr_))) as executor:
+                futures = [executor.submit(encode_and_put, identifier) for identifier in repr_]
+                for future in futures:
+                    future.result()
+        else:
+            for identifier in repr_:
+                encode_and_put(identifier)
+
     def deserialize(self, representation: Union[str, Dict[str, Any]]) -> Serializable:
         """Loads a stored Serializable object or converts a dictionary representation back to the
             corresponding Serializable.
@@ -746,21 +1323,18 @@ class Serializer(object):
         if isinstance(representation, str):
             if representation in self.__subpulses:
                 return self.__subpulses[representation].serializable
-
-        if isinstance(representation, str):
-            repr_ = json.loads(self.__storage_backend.get(representation))
+            repr_ = _loads_json(self.__storage_backend.get(representation))
             repr_['identifier'] = representation
         else:
             repr_ = dict(representation)
 
-        module_name, class_name = repr_['type'].rsplit('.', 1)
-        module = __import__(module_name, fromlist=[class_name])
-        class_ = getattr(module, class_name)
-
-        repr_to_store = repr_.copy()
-        repr_.pop('type')
+        type_identifier = repr_.pop('type')
+        try:
+            deserialization_callback = SerializableMeta.deserialization_callbacks[type_identifier]
+        except KeyError:
+            deserialization_callback = _import_deserialization_callback(type_identifier)
 
-        serializable = class_.deserialize(self, **repr_)
+        serializable = deserialization_callback(self, **repr_)
 
         if 'identifier' in repr_:
             identifier = repr_['identifier']
@@ -811,12 +1385,51 @@ class PulseStorage(MutableMapping[str, Serializable]):
         self._storage_backend = storage_backend
 
         self._temporary_storage = dict() # type: Dict[str, StorageEntry]
-        self._transaction_storage = None
+
+        # During a transaction the pending entries are held in two parallel dicts instead of one dict of
+        # StorageEntry tuples, saving one tuple object per entry; the serialized dict is additionally handed
+        # to put_many unchanged at commit time. Both are None outside a transaction.
+        self._txn_serialized = None # type: Optional[Dict[str, str]]
+        self._txn_serializable = None # type: Optional[Dict[str, Serializable]]
+
+        # Maps id(serializable) to a (weak reference, serialized string) pair. Since Serializables are
+        # immutable once constructed, the encoded JSON of a live object can be reused when it is stored
+        # again, e.g. after the temporary storage was cleared. Entries vanish with their object.
+        self._encode_memo = {} # type: Dict[int, Tuple[weakref.ref, str]]
+
+        # Interns serialized strings so equal-content pulses (e.g. repeated template instances) share
+        # one string object instead of keeping one full-size copy each. Cleared together with the
+        # temporary storage.
+        self._serialization_intern = {} # type: Dict[str, str]
+
+    def _memoized_encode(self, serializable: Serializable) -> str:
+        """Returns the serialized representation of the given Serializable.
+
+        The encoded JSON is remembered per object (keyed by identity, dropped when the object dies) so
+        storing the identical object again skips walking and encoding the whole pulse (sub)tree. The memo
+        is only valid within this PulseStorage because encoding also stores nested identified Serializables
+        as a side effect, which a fresh storage backend would miss.
+        """
+        key = id(serializable)
+        memo_entry = self._encode_memo.get(key)
+        if memo_entry is not None and memo_entry[0]() is serializable:
+            return memo_entry[1]
+
+        # sort_keys=True together with indent=4 is the canonical storage format existing pulse libraries
+        # are written in; emitting insertion order instead would change the stored bytes. The sort itself
+        # is cheap since get_serialization_data returns small, mostly pre-sorted dicts.
+        encoder = JSONSerializableEncoder(self, sort_keys=True, indent=4)
+        serialized = encoder.encode(serializable.get_serialization_data())
+        serialized = self._serialization_intern.setdefault(serialized, serialized)
+
+        def evict(_, memo=self._encode_memo, key=key):
+            memo.pop(key, None)
+        self._encode_memo[key] = (weakref.ref(serializable, evict), serialized)
+        return serialized
 
     def _deserialize(self, serialization: str) -> Serializable:
         decoder = JSONSerializableDecoder(storage=self)
-        serializable = decoder.decode(serialization)
-        return serializable
+        return decoder.decode(serialization)
 
     def _load_and_deserialize(self, identifier: str) -> StorageEntry:
         serialization = self._storage_backend[identifier]
@@ -833,7 +1446,11 @@ class PulseStorage(MutableMapping[str, Serializable]):
         return self._temporary_storage
 
     def __contains__(self, identifier) -> bool:
-        return identifier in self._temporary_storage or identifier in self._storage_backend
+        if identifier in self._temporary_storage:
+            return True
+        if self._txn_serialized is not None and identifier in self._txn_serialized:
+            return True
+        return identifier in self._storage_backend
 
     def __getitem__(self, identifier: str) -> Serializable:
         """Fetch a Serializable.
@@ -845,6 +1462,8 @@ class PulseStorage(MutableMapping[str, Serializable]):
             identifier: The identifier of the Serializable to load.
         """
         if identifier not in self._temporary_storage:
+            if self._txn_serializable is not None and identifier in self._txn_serializable:
+                return self._txn_serializable[identifier]
             self._load_and_deserialize(identifier)
         return self._temporary_storage[identifier].serializable
 
@@ -877,6 +1496,13 @@ class PulseStorage(MutableMapping[str, Serializable]):
                 return
             else:
                 raise RuntimeError('Identifier assigned twice with different objects', identifier)
+        elif self._txn_serializable is not None and identifier in self._txn_serializable:
+            # the identifier was already serialized within the running transaction: do not probe the backend or
+            # encode the subtree again
+            if self._txn_serializable[identifier] is serializable:
+                return
+            else:
+                raise RuntimeError('Identifier assigned twice with different objects', identifier)
         elif identifier in self._storage_backend:
             raise RuntimeError('Identifier already assigned in storage backend', identifier)
         self.overwrite(identifier, serializable)
@@ -884,16 +1510,18 @@ class PulseStorage(MutableMapping[str, Serializable]):
     def __delitem__(self, identifier: str) -> None:
         """Delete an item from temporary storage and storage backend.
 
-        Does not raise an error if the deleted pulse is only in the storage backend. Assumes that all pulses
-        contained in temporary storage are always also contained in the storage backend.
+        Does not raise an error if the deleted pulse is only in the storage backend.
+
+        All serialization reuse caches are invalidated: a cached serialization of any other pulse may embed
+        a reference to the deleted one, and reusing it on a later overwrite would skip the encoder run that
+        re-stores referenced sub-pulses missing from the backend.
         Args:
             identifier: Identifier of the Serializable to delete
         """
         del self._storage_backend[identifier]
-        try:
-            del self._temporary_storage[identifier]
-        except KeyError:
-            pass
+        self._temporary_storage.clear()
+        self._encode_memo.clear()
+        self._serialization_intern.clear()
 
     @property
     def contents(self) -> Iterable[str]:
@@ -912,36 +1540,54 @@ class PulseStorage(MutableMapping[str, Serializable]):
         provided serializable. It does _not_ overwrite nested Serializable objects contained in serializable. If you
         want to overwrite those as well, do that explicitly.
 
+        Since Serializables are immutable once constructed, a cached serialization from a previous write of the
+        identical object is reused instead of encoding the whole pulse (sub)tree again.
+
         Args:
               identifier: The identifier to store serializable under.
               serializable: The Serializable object to be stored.
         """
 
-        is_transaction_begin = (self._transaction_storage is None)
+        is_transaction_begin = (self._txn_serialized is None)
+        gc_was_enabled = False
         try:
             if is_transaction_begin:
-                self._transaction_storage = dict()
-
-            encoder = JSONSerializableEncoder(self, sort_keys=True, indent=4)
-
-            serialization_data = serializable.get_serialization_data()
-            serialized = encoder.encode(serialization_data)
-            self._transaction_storage[identifier] = self.StorageEntry(serialized, serializable)
+                self._txn_serialized = dict()
+                self._txn_serializable = dict()
+                # The stdlib encoder's iterencode builds mutually recursive closures that form reference
+                # cycles on every encode, so commit-heavy workloads flood the cyclic garbage collector.
+                # Pause collection for the duration of the commit; the garbage is reaped afterwards.
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+
+            previous_entry = self._temporary_storage.get(identifier)
+            if previous_entry is not None and previous_entry.serializable is serializable:
+                serialized = previous_entry.serialization
+            else:
+                serialized = self._memoized_encode(serializable)
+            self._txn_serialized[identifier] = serialized
+            self._txn_serializable[identifier] = serializable
 
             if is_transaction_begin:
-                for identifier, entry in self._transaction_storage.items():
-                    self._storage_backend.put(identifier, entry.serialization, overwrite=True)
-                self._temporary_storage.update(**self._transaction_storage)
+                self._storage_backend.put_many(self._txn_serialized, overwrite=True)
+                txn_serializable = self._txn_serializable
+                for identifier, serialized in self._txn_serialized.items():
+                    self._temporary_storage[identifier] = self.StorageEntry(serialized,
+                                                                            txn_serializable[identifier])
 
         finally:
             if is_transaction_begin:
-                self._transaction_storage = None
+                if gc_was_enabled:
+                    gc.enable()
+                self._txn_serialized = None
+                self._txn_serializable = None
 
     def clear(self) -> None:
         """Clears the temporary storage.
 
         Does not affect the storage backend."""
         self._temporary_storage.clear()
+        self._serialization_intern.clear()
 
     @contextmanager
     def as_default_registry(self) -> Any:
@@ -985,15 +1631,27 @@ class JSONSerializableDecoder(json.JSONDecoder):
         super().__init__(*args, object_hook=self.filter_serializables, **kwargs)
 
         self.storage = storage
+        # hoisted out of filter_serializables, which runs once per decoded object node
+        self._callbacks = SerializableMeta.deserialization_callbacks
+        self._storage_is_default_registry = (get_default_pulse_registry() is storage)
+
+    def decode(self, s: str, *args, **kwargs) -> Any:
+        if orjson is not None and not args and not kwargs:
+            # orjson parses in C but has no object_hook, so apply filter_serializables in a separate pass over
+            # the parsed tree. This is still considerably faster than the stdlib decoder for large pulses.
+            try:
+                parsed = orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # the stdlib encoder may emit NaN/Infinity or integers beyond 64 bit which orjson rejects
+                return super().decode(s)
+            return _apply_object_hook(parsed, self.filter_serializables)
+        return super().decode(s, *args, **kwargs)
 
     def filter_serializables(self, obj_dict) -> Any:
-        if Serializable.type_identifier_name in obj_dict:
-            type_identifier = obj_dict.pop(Serializable.type_identifier_name)
-
-            if Serializable.identifier_name in obj_dict:
-                obj_identifier = obj_dict.pop(Serializable.identifier_name)
-            else:
-                obj_identifier = None
+        # this runs once per JSON object node, so avoid the separate membership tests before each pop
+        type_identifier = obj_dict.pop(Serializable.type_identifier_name, None)
+        if type_identifier is not None:
+            obj_identifier = obj_dict.pop(Serializable.identifier_name, None)
 
             if type_identifier == 'reference':
                 if not obj_identifier:
@@ -1001,14 +1659,14 @@ class JSONSerializableDecoder(json.JSONDecoder):
                 return self.storage[obj_identifier]
 
             else:
-                deserialization_callback = SerializableMeta.deserialization_callbacks[type_identifier]
+                deserialization_callback = self._callbacks[type_identifier]
 
                 # if the storage is the default registry, we would get conflicts when the Serializable tries to register
                 # itself on construction. Pass an empty dict as registry keyword argument in this case.
                 # calling PulseStorage objects will take care of registering.
                 # (solution to issue #301: https://github.com/qutech/qupulse/issues/301 )
                 registry = None
-                if get_default_pulse_registry() is self.storage:
+                if self._storage_is_default_registry:
                     registry = dict()
 
                 return deserialization_callback(identifier=obj_identifier, registry=registry, **obj_dict)
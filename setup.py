@@ -43,6 +43,7 @@ setup(name='qupulse',
           'tabor-instruments': ['pytabor>=1.0.1', 'teawg'],
           'zurich-instruments': ['zhinst'],
           'Faster-fractions': ['gmpy2'],
+          'Faster-serialization': ['orjson'],
           'tektronix': 'tek_awg>=0.2.1'
       },
       test_suite="tests",
@@ -1,4 +1,5 @@
 import unittest
+import math
 import os
 import sys
 import zipfile
@@ -11,7 +12,8 @@ from abc import ABCMeta, abstractmethod
 from tempfile import TemporaryDirectory, NamedTemporaryFile, TemporaryFile
 from typing import Optional, Any, Tuple
 
-from qupulse.serialization import FilesystemBackend, CachingBackend, Serializable, JSONSerializableEncoder,\
+from qupulse.serialization import FilesystemBackend, AggregatedFilesystemBackend, CachingBackend, Serializable, \
+    JSONSerializableEncoder,\
     ZipFileBackend, AnonymousSerializable, DictBackend, PulseStorage, JSONSerializableDecoder, Serializer,\
     get_default_pulse_registry, set_default_pulse_registry, new_default_pulse_registry, SerializableMeta, \
     PulseRegistryType, DeserializationCallbackFinder, StorageBackend
@@ -32,8 +34,8 @@ class DummySerializable(Serializable):
         self._register(registry=registry)
 
     def get_serialization_data(self, serializer: Optional[Serializer]=None):
+        # the identifier lives in a __slots__ descriptor on Serializable and hence not in __dict__
         local_data = dict(**self.__dict__)
-        del local_data['_Serializable__identifier']
         if not serializer: # deprecated version for compatability with old serialization routine tests
             data = super().get_serialization_data()
             data.update(**local_data)
@@ -45,7 +47,7 @@ class DummySerializable(Serializable):
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, DummySerializable): return False
-        return self.__dict__ == other.__dict__
+        return self.identifier == other.identifier and self.__dict__ == other.__dict__
 
 
 class SerializableTests(metaclass=ABCMeta):
@@ -315,6 +317,25 @@ class StorageBackendTest(unittest.TestCase):
                 del(storage['foo'])
             self.assertEqual(mock.call('foo'), delete_mock.call_args)
 
+    def test_put_many(self) -> None:
+        with mock.patch.object(StorageBackend, 'put') as put_mock:
+            storage = StorageBackend()
+            storage.put_many({'foo': 'bar', 'hugo': 'ilse'}, overwrite=True)
+            self.assertEqual([mock.call('foo', 'bar', True), mock.call('hugo', 'ilse', True)],
+                             put_mock.call_args_list)
+
+    def test_get_many(self) -> None:
+        data = {'foo': 'bar', 'hugo': 'ilse'}
+        with mock.patch.object(StorageBackend, 'get', side_effect=data.__getitem__):
+            storage = StorageBackend()
+            self.assertEqual(data, storage.get_many(['foo', 'hugo']))
+
+    def test_put_bytes(self) -> None:
+        with mock.patch.object(StorageBackend, 'put') as put_mock:
+            storage = StorageBackend()
+            storage.put_bytes('foo', 'bär'.encode('utf-8'), overwrite=True)
+            self.assertEqual(mock.call('foo', 'bär', True), put_mock.call_args)
+
     def test_list_contents(self) -> None:
         expected = {'hugo', 'ilse', 'foo.bar'}
         with warnings.catch_warnings():
@@ -387,6 +408,20 @@ class FileSystemBackendTest(unittest.TestCase):
         self.backend.put(name, self.alternative_testdata, overwrite=True)
         self.assertEqual(self.alternative_testdata, self.backend.get(name))
 
+    def test_get_large_file_mmap(self) -> None:
+        large_data = self.test_data * (2 * FilesystemBackend._MMAP_THRESHOLD // len(self.test_data))
+        self.backend.put(self.identifier, large_data)
+        self.assertEqual(large_data, self.backend.get(self.identifier))
+
+    def test_put_bytes(self) -> None:
+        self.backend.put_bytes(self.identifier, self.test_data.encode('utf-8'))
+        self.assertEqual(self.test_data, self.backend.get(self.identifier))
+
+        with self.assertRaises(FileExistsError):
+            self.backend.put_bytes(self.identifier, self.alternative_testdata.encode('utf-8'))
+        self.backend.put_bytes(self.identifier, self.alternative_testdata.encode('utf-8'), overwrite=True)
+        self.assertEqual(self.alternative_testdata, self.backend.get(self.identifier))
+
     def test_instantiation_fail(self) -> None:
         with self.assertRaises(NotADirectoryError):
             FilesystemBackend("C\\#~~")
@@ -426,6 +461,107 @@ class FileSystemBackendTest(unittest.TestCase):
         self.assertEqual(set(), set(iter(self.backend)))
 
 
+class AggregatedFilesystemBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.backend = AggregatedFilesystemBackend(self.tmp_dir.name)
+        self.test_data = 'dshiuasduzchjbfdnbewhsdcuzd'
+        self.alternative_testdata = "8u993zhhbn\nb3tadgadg"
+
+        self.identifier = 'some name'
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_init_create_dir(self) -> None:
+        path = self.tmp_dir.name + "/inner_dir"
+        self.assertFalse(os.path.isdir(path))
+        with self.assertRaises(NotADirectoryError):
+            AggregatedFilesystemBackend(path)
+        self.assertFalse(os.path.isdir(path))
+        AggregatedFilesystemBackend(path, create_if_missing=True)
+        self.assertTrue(os.path.isdir(path))
+
+    def test_put_and_get_normal(self) -> None:
+        self.backend.put(self.identifier, self.test_data)
+
+        data = self.backend.get(self.identifier)
+        self.assertEqual(data, self.test_data)
+
+    def test_put_file_exists_no_overwrite(self) -> None:
+        name = 'test_put_file_exists_no_overwrite'
+        self.backend.put(name, self.test_data)
+        with self.assertRaises(FileExistsError):
+            self.backend.put(name, self.alternative_testdata)
+        self.assertEqual(self.test_data, self.backend.get(name))
+
+    def test_put_file_exists_overwrite(self) -> None:
+        name = 'test_put_file_exists_overwrite'
+        self.backend.put(name, self.test_data)
+        self.backend.put(name, self.alternative_testdata, overwrite=True)
+        self.assertEqual(self.alternative_testdata, self.backend.get(name))
+
+    def test_put_many_and_get_many(self) -> None:
+        entries = {'foo': self.test_data, 'bar': self.alternative_testdata, 'hugo.test': 'some more data'}
+        self.backend.put_many(entries)
+        self.assertEqual(entries, self.backend.get_many(entries.keys()))
+        # all entries of the batch share a single blob file
+        self.assertEqual({'storage.blob', 'storage.manifest.json'}, set(os.listdir(self.tmp_dir.name)))
+
+    def test_exists(self) -> None:
+        name = 'test_exists'
+        self.backend.put(name, self.test_data)
+        self.assertTrue(self.backend.exists(name))
+        self.assertFalse(self.backend.exists('exists_not'))
+
+    def test_get_not_existing(self) -> None:
+        name = 'test_get_not_existing'
+        with self.assertRaisesRegex(KeyError, name):
+            self.backend.get(name)
+
+    def test_delete(self):
+        name = 'test_delete'
+        with self.assertRaisesRegex(KeyError, name):
+            self.backend.delete(name)
+
+        self.backend.put(name, self.test_data)
+        self.assertTrue(self.backend.exists(name))
+        self.backend.delete(name)
+        self.assertFalse(self.backend.exists(name))
+
+    def test_compact(self) -> None:
+        self.backend.put('foo', self.test_data)
+        self.backend.put('bar', self.alternative_testdata)
+        self.backend.put('foo', self.alternative_testdata, overwrite=True)
+        self.backend.delete('bar')
+
+        self.backend.compact()
+
+        self.assertEqual(len(self.alternative_testdata.encode('utf-8')),
+                         os.path.getsize(os.path.join(self.tmp_dir.name, 'storage.blob')))
+        self.assertEqual(self.alternative_testdata, self.backend.get('foo'))
+
+    def test_visible_across_instances(self) -> None:
+        self.backend.put(self.identifier, self.test_data)
+        other_backend = AggregatedFilesystemBackend(self.tmp_dir.name)
+        self.assertEqual(self.test_data, other_backend.get(self.identifier))
+
+        self.backend.put('later', self.alternative_testdata)
+        self.assertEqual(self.alternative_testdata, other_backend.get('later'))
+
+    def test_get_contents_iter_len(self) -> None:
+        expected = {'foo', 'bar', 'hugo.test'}
+        for name in expected:
+            self.backend.put(name, self.test_data)
+
+        self.assertEqual(expected, self.backend.list_contents(), msg="list_contents() faulty")
+        self.assertEqual(expected, set(iter(self.backend)), msg="__iter__() faulty")
+        self.assertEqual(3, len(self.backend), msg="__len__() faulty")
+
+    def test_iter_empty(self) -> None:
+        self.assertEqual(set(), set(iter(self.backend)))
+
+
 class ZipFileBackendTests(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -522,6 +658,42 @@ class ZipFileBackendTests(unittest.TestCase):
         with zipfile.ZipFile(self.path, 'r') as file:
             self.assertNotIn('foo', file.namelist())
 
+    def test_transaction(self):
+        self.backend.put('foo', 'foo_data')
+
+        with self.backend.transaction():
+            self.backend.put('bar', 'bar_data')
+            self.backend.put('foo', 'foo_bar_data', overwrite=True)
+            with self.assertRaises(FileExistsError):
+                self.backend.put('bar', 'other_data')
+
+            # deferred operations are visible inside the transaction
+            self.assertTrue(self.backend.exists('bar'))
+            self.assertEqual(self.backend.get('foo'), 'foo_bar_data')
+
+            self.backend.delete('bar')
+            self.assertFalse(self.backend.exists('bar'))
+            self.backend.put('bar', 'bar_data')
+
+            # ...but not yet in the archive
+            with zipfile.ZipFile(self.path, 'r') as zip_file:
+                self.assertNotIn('bar.json', zip_file.namelist())
+
+        self.assertEqual(self.backend.get('foo'), 'foo_bar_data')
+        self.assertEqual(self.backend.get('bar'), 'bar_data')
+
+    def test_transaction_discarded_on_error(self):
+        self.backend.put('foo', 'foo_data')
+
+        with self.assertRaisesRegex(RuntimeError, 'kaputt'):
+            with self.backend.transaction():
+                self.backend.put('bar', 'bar_data')
+                self.backend.put('foo', 'foo_bar_data', overwrite=True)
+                raise RuntimeError('kaputt')
+
+        self.assertFalse(self.backend.exists('bar'))
+        self.assertEqual(self.backend.get('foo'), 'foo_data')
+
     def test_get_contents_iter_len(self) -> None:
         expected = {'foo', 'bar', 'hugo.test'}
         for name in expected:
@@ -636,6 +808,34 @@ class CachingBackendTests(unittest.TestCase):
     def test_iter_empty(self) -> None:
         self.assertEqual(set(), set(iter(self.caching_backend)))
 
+    def test_lru_eviction(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            caching_backend = CachingBackend(self.dummy_backend, max_bytes=3*sys.getsizeof('x'*100))
+
+        for name in ('a', 'b', 'c'):
+            caching_backend.put(name, 'x'*100)
+
+        # 'a' is the least recently used entry; touch it so 'b' gets evicted instead
+        caching_backend.get('a')
+        caching_backend.put('d', 'x'*100)
+
+        self.assertEqual({'a', 'c', 'd'}, set(caching_backend._cache))
+
+        # evicted entries are transparently fetched from the backend again
+        self.assertEqual('x'*100, caching_backend.get('b'))
+
+    def test_max_entries_eviction(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            caching_backend = CachingBackend(self.dummy_backend, max_entries=2)
+
+        for name in ('a', 'b', 'c'):
+            caching_backend.put(name, 'x')
+
+        self.assertEqual({'b', 'c'}, set(caching_backend._cache))
+        self.assertEqual('x', caching_backend.get('a'))
+
 
 class DictBackendTests(unittest.TestCase):
     def setUp(self):
@@ -842,6 +1042,29 @@ class PulseStorageTests(unittest.TestCase):
             storage['my_id'] = serializable
         self.assertEqual({'my_id': 'data_in_storage'}, backend.stored_items)
 
+    def test_setitem_repeated_reference_in_transaction(self) -> None:
+        inner_instance = DummySerializable(identifier='my_id_inner', registry=dict())
+        outer_instance = DummySerializable(first=inner_instance, second=inner_instance,
+                                           identifier='my_id_outer', registry=dict())
+
+        self.storage['my_id_outer'] = outer_instance
+
+        self.assertEqual({'my_id_inner', 'my_id_outer'}, set(self.backend.stored_items))
+        # one probe for the outer identifier and two for the first reference to the inner one; the second
+        # reference must reuse the in-flight transaction entry instead of probing the backend again
+        self.assertEqual(3, self.backend.times_exists_called)
+        # the inner serializable must not have been fetched back from the backend for the identity check
+        self.assertEqual(0, self.backend.times_get_called)
+
+    def test_setitem_repeated_identifier_in_transaction(self) -> None:
+        inner_a = DummySerializable(identifier='my_id_inner', data='a', registry=dict())
+        inner_b = DummySerializable(identifier='my_id_inner', data='b', registry=dict())
+        outer_instance = DummySerializable(first=inner_a, second=inner_b,
+                                           identifier='my_id_outer', registry=dict())
+
+        with self.assertRaisesRegex(RuntimeError, "already taken"):
+            self.storage['my_id_outer'] = outer_instance
+
     def test_overwrite(self):
 
         encode_mock = mock.Mock(return_value='asd')
@@ -856,6 +1079,62 @@ class PulseStorageTests(unittest.TestCase):
 
         self.assertEqual(self.storage._temporary_storage, {'my_id': self.storage.StorageEntry('asd', instance)})
 
+    def test_non_finite_float_roundtrip(self):
+        # the stdlib encoder emits NaN/Infinity; the decode fast path must not make stored pulses unloadable
+        instance = DummySerializable(identifier='my_id', data=[float('nan'), float('inf')], registry=dict())
+        self.storage['my_id'] = instance
+        self.storage.clear()
+
+        loaded = self.storage['my_id']
+        self.assertTrue(math.isnan(loaded.data[0]))
+        self.assertEqual(float('inf'), loaded.data[1])
+
+    def test_overwrite_after_delete_restores_subpulses(self):
+        inner_instance = DummySerializable(identifier='my_id_inner', registry=dict())
+        outer_instance = DummySerializable(data=inner_instance, identifier='my_id_outer', registry=dict())
+
+        self.storage['my_id_outer'] = outer_instance
+        del self.storage['my_id_inner']
+
+        # the cached serialization of the outer pulse must not be reused: re-encoding re-stores the
+        # referenced inner pulse which is missing from the backend again
+        self.storage.overwrite('my_id_outer', outer_instance)
+        self.assertIn('my_id_inner', self.backend.stored_items)
+
+    def test_overwrite_same_object_skips_encode(self):
+        instance = DummySerializable(identifier='my_id', registry=dict())
+        self.storage.overwrite('my_id', instance)
+        expected_serialization = self.storage.temporary_storage['my_id'].serialization
+
+        with mock.patch.object(PulseStorage, '_memoized_encode') as encode_mock:
+            self.storage.overwrite('my_id', instance)
+        encode_mock.assert_not_called()
+        self.assertIs(expected_serialization, self.storage.temporary_storage['my_id'].serialization)
+
+    def test_overwrite_memoized_encode_after_clear(self):
+        instance = DummySerializable(identifier='my_id', registry=dict())
+        self.storage.overwrite('my_id', instance)
+        expected_serialization = self.backend.stored_items['my_id']
+
+        self.storage.clear()
+
+        with mock.patch.object(JSONSerializableEncoder, 'encode') as encode_mock:
+            self.storage.overwrite('my_id', instance)
+        encode_mock.assert_not_called()
+        self.assertEqual(expected_serialization, self.backend.stored_items['my_id'])
+
+    def test_serialization_interning(self):
+        instance_a = DummySerializable(identifier='my_id', data='foo', registry=dict())
+        instance_b = DummySerializable(identifier='my_id', data='foo', registry=dict())
+
+        self.storage.overwrite('my_id', instance_a)
+        first_serialization = self.storage.temporary_storage['my_id'].serialization
+        self.storage.overwrite('my_id', instance_b)
+        second_serialization = self.storage.temporary_storage['my_id'].serialization
+
+        # equal-content serializations share one string object
+        self.assertIs(first_serialization, second_serialization)
+
     def test_write_through(self):
         instance_1 = DummySerializable(identifier='my_id_1', registry=dict())
         inner_instance = DummySerializable(identifier='my_id_2', registry=dict())
@@ -1394,6 +1673,16 @@ class SerializerTests(unittest.TestCase):
         expected[inner_serializable.identifier]['type'] = self.serializer.get_type_identifier(inner_serializable)
         self.__serialization_test_helper(serializable, expected)
 
+    def test_serialize_parallel_backend(self) -> None:
+        inner_serializable = DummySerializable(data='bar', identifier='foo')
+        serializable = NestedDummySerializable(data=inner_serializable, identifier='outer_foo')
+        expected = {serializable.identifier: serializable.get_serialization_data(self.serializer),
+                    inner_serializable.identifier: inner_serializable.get_serialization_data(self.serializer)}
+        expected[serializable.identifier]['type'] = self.serializer.get_type_identifier(serializable)
+        expected[inner_serializable.identifier]['type'] = self.serializer.get_type_identifier(inner_serializable)
+        self.backend.supports_parallel_put = True
+        self.__serialization_test_helper(serializable, expected)
+
     def test_deserialize_dict(self) -> None:
         deserialized = self.serializer.deserialize(self.deserialization_data)
         self.assertIsInstance(deserialized, DummySerializable)